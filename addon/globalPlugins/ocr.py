@@ -8,8 +8,14 @@ This plugin uses Tesseract for OCR: https://github.com/tesseract-ocr
 """
 
 import os
+import array
+import ctypes
+import bisect
+import functools
+import re
 import tempfile
 import subprocess
+import threading
 from xml.parsers import expat
 from collections import namedtuple
 from copy import copy
@@ -24,7 +30,7 @@ import ui
 import locationHelper
 import scriptHandler
 import config
-from io import StringIO
+from io import StringIO, BytesIO
 from configobj import ConfigObj
 from logHandler import log
 
@@ -42,6 +48,7 @@ OCR_QUALITIES = {
 }
 
 POSSIBLE_QUALITIES = ''.join('"{}", '.format(q.dirName) for q in OCR_QUALITIES.values())
+QUALITY_INDEXES_BY_DIR_NAME = {v.dirName: k for k, v in OCR_QUALITIES.items()}
 
 priorityInfo = namedtuple("priorityInfo", ("translatedName", "priorityConstant"))
 
@@ -60,14 +67,81 @@ OCR_PRIORITIES = {
 }
 
 POSSIBLE_PRIORITIES = ''.join('"{}", '.format(prioName) for prioName in OCR_PRIORITIES.keys())
+PRIORITY_IDS_BY_TRANSLATED_NAME = {v.translatedName: k for k, v in OCR_PRIORITIES.items()}
+
+IMAGE_RESIZE_FACTOR = 2
+# Text on screens with at least this many pixels per inch is large enough to be recognized without enlarging.
+HIGH_DPI = 120
+
+resizeInfo = namedtuple("resizeInfo", ("translatedName", "factor"))
+
+# How much images are enlarged before being recognized, None meaning that it depends on the screen resolution
+OCR_IMAGE_ENLARGEMENTS = {
+	# Translators: Image enlargement option in OCR settings
+	"auto": resizeInfo(_("depending on screen resolution"), None),
+	# Translators: Image enlargement option in OCR settings
+	"always": resizeInfo(_("always"), IMAGE_RESIZE_FACTOR),
+	# Translators: Image enlargement option in OCR settings
+	"never": resizeInfo(_("never"), 1)
+}
+
+POSSIBLE_IMAGE_ENLARGEMENTS = ''.join('"{}", '.format(enlargementID) for enlargementID in OCR_IMAGE_ENLARGEMENTS.keys())
+IMAGE_ENLARGEMENT_IDS_BY_TRANSLATED_NAME = {v.translatedName: k for k, v in OCR_IMAGE_ENLARGEMENTS.items()}
 
 PLUGIN_DIR = os.path.dirname(__file__)
 TESSERACT_EXE = os.path.join(PLUGIN_DIR, "tesseract", "bin", "tesseract.exe")
 TESSDATA_BASEDIR = os.path.join(PLUGIN_DIR, "tesseract", "tessdata")
-
-IMAGE_RESIZE_FACTOR = 2
-
-OcrWord = namedtuple("OcrWord", ("offset", "left", "top"))
+# Process creation flag which prevents a console window from being created for Tesseract.
+CREATE_NO_WINDOW = 0x08000000
+
+# Objects recognized within this many milliseconds of each other are passed to a single Tesseract run.
+BATCH_DELAY = 150
+
+# Each waiting Tesseract process keeps its language data loaded,
+# so only processes for the most recently used languages are kept.
+MAX_STANDBY_TESSERACTS = 2
+
+# When enabled in settings, tall objects are split into horizontal strips
+# recognized by separate Tesseract processes in parallel.
+# Layout analysis then sees each strip separately, so text in columns is read strip by strip
+# rather than column by column, which is why splitting is off by default.
+# Strips are at least this many pixels high and overlap by STRIP_OVERLAP pixels,
+# so that lines cut at the edge of one strip are recognized whole in its neighbour.
+MIN_STRIP_HEIGHT = 400
+STRIP_OVERLAP = 50
+MAX_STRIPS = 4
+
+# linesTops, if given, is the range of vertical image coordinates
+# at which lines have to start to be included in the results.
+pageInfo = namedtuple("pageInfo", ("left", "top", "resizeFactor", "linesTops"), defaults=(None,))
+
+# Only left and top coordinates of the word's bounding box are needed.
+# The match method is bound once, as it is called for every recognized word.
+matchBbox = re.compile(r"bbox (\d+) (\d+)").match
+
+# Classes of hOCR elements containing a single line of text.
+# Apart from ordinary lines, Tesseract 4.1 and newer marks headings, captions and floating text this way.
+LINE_CLASSES = frozenset(("ocr_line", "ocr_header", "ocr_caption", "ocr_textfloat"))
+
+
+def getShortPathName(path):
+	"""Returns the 8.3 form of the given path, which unlike the long one can be encoded in the ANSI code page.
+	If short names are disabled for the volume the path is returned unchanged.
+	"""
+	bufSize = ctypes.windll.kernel32.GetShortPathNameW(path, None, 0)
+	if not bufSize:
+		return path
+	buf = ctypes.create_unicode_buffer(bufSize)
+	if not ctypes.windll.kernel32.GetShortPathNameW(path, buf, bufSize):
+		return path
+	return buf.value
+
+
+def getImageResizeFactor():
+	factor = OCR_IMAGE_ENLARGEMENTS[config.conf["ocr"]["imageEnlargement"]].factor
+	if factor is None:
+		factor = 1 if wx.ScreenDC().GetPPI().height >= HIGH_DPI else IMAGE_RESIZE_FACTOR
+	return factor
 
 
 class LanguageInfo:
@@ -112,8 +186,6 @@ class LanguageInfo:
 		"vi": "vie"
 	}
 
-	tesseractLangsToNVDALocales = {v: k for k, v in NVDALocalesToTesseractLangs.items()}
-
 	TesseractLocalesToWindowsLocalizedLangNames = dict()
 	WindowsLocalizedLangNamesToTesseractLocales = dict()
 
@@ -126,7 +198,7 @@ class LanguageInfo:
 		if self._NVDALocaleName and self._TesseractLocaleName is None:
 			self._TesseractLocaleName = self.NVDALocalesToTesseractLangs[self._NVDALocaleName]
 		elif self._TesseractLocaleName and self._NVDALocaleName is None:
-			self._NVDALocaleName = self.tesseractLangsToNVDALocales[self._TesseractLocaleName]
+			self._NVDALocaleName = self.tesseractLangsToNVDALocales()[self._TesseractLocaleName]
 		if(
 			self._TesseractLocaleName
 			and self._TesseractLocaleName in self.TesseractLocalesToWindowsLocalizedLangNames
@@ -139,33 +211,67 @@ class LanguageInfo:
 		):
 			self._TesseractLocaleName = self.WindowsLocalizedLangNamesToTesseractLocales[self._localizedName]
 
+	@classmethod
+	@functools.lru_cache(maxsize=1)
+	def tesseractLangsToNVDALocales(cls):
+		# Built on first use rather than when NVDA starts, as many sessions never use OCR.
+		return {v: k for k, v in cls.NVDALocalesToTesseractLangs.items()}
+
 	@staticmethod
+	@functools.lru_cache(maxsize=len(OCR_QUALITIES))
 	def availableTesseractLanguageFiles(quality):
-		for file in os.listdir(os.path.join(PLUGIN_DIR, "tesseract", "tessdata", quality)):
-			if file.endswith(".traineddata"):
-				yield os.path.splitext(file)[0]
+		# Language files change only when the add-on is updated, so the directory is listed only once.
+		return tuple(
+			os.path.splitext(file)[0]
+			for file in os.listdir(os.path.join(TESSDATA_BASEDIR, quality))
+			if file.endswith(".traineddata")
+		)
 
 	@classmethod
 	def fromAvailableLanguages(cls, quality):
 		for langFN in cls.availableTesseractLanguageFiles(quality):
 			yield cls(TesseractLocaleName=langFN)
 
+	@classmethod
+	def configuredTesseractLocaleName(cls):
+		# Until a language is chosen in the settings recognition follows the language of NVDA,
+		# which is resolved only when first needed rather than when the configuration spec is built.
+		return config.conf["ocr"]["language"] or cls.fromCurrentNVDALanguage().TesseractLocaleName
+
 	@classmethod
 	def fromConfiguredLanguage(cls):
-		return cls(TesseractLocaleName=config.conf["ocr"]["language"])
+		return cls(TesseractLocaleName=cls.configuredTesseractLocaleName())
 
 	@classmethod
 	def fromFallbackLanguage(cls):
 		return cls(TesseractLocaleName=LanguageInfo.FALLBACK_LANGUAGE)
 
 	@classmethod
+	@functools.lru_cache(maxsize=1)
 	def fromCurrentNVDALanguage(cls):
+		# NVDA has to be restarted for the language change to take effect,
+		# so this can safely be resolved only once.
 		currentNVDALang = languageHandler.getLanguage()
-		for possibleLocaleName in (currentNVDALang, currentNVDALang.split("_")[0], cls.FALLBACK_LANGUAGE):
-			try:
-				return cls(NVDALocaleName=possibleLocaleName)
-			except KeyError:
-				continue
+		TesseractLocaleName = (
+			cls.NVDALocalesToTesseractLangs.get(currentNVDALang)
+			or cls.NVDALocalesToTesseractLangs.get(currentNVDALang.split("_")[0])
+			or cls.FALLBACK_LANGUAGE
+		)
+		return cls(TesseractLocaleName=TesseractLocaleName)
+
+	@classmethod
+	@functools.lru_cache(maxsize=1)
+	def cacheLocalizedNames(cls):
+		"""Resolves localized names of all available languages at once,
+		so that afterwards they are only looked up in the dictionaries above."""
+		for quality in OCR_QUALITIES.values():
+			cls.availableLocalizedNames(quality.dirName)
+
+	@classmethod
+	@functools.lru_cache(maxsize=len(OCR_QUALITIES))
+	def availableLocalizedNames(cls, quality):
+		"""Returns localized names of all languages available in the given quality."""
+		return tuple(lang.localizedName for lang in cls.fromAvailableLanguages(quality))
 
 	@property
 	def localizedName(self):
@@ -173,13 +279,13 @@ class LanguageInfo:
 		res = self._localizedName
 		if res is None:
 			res = languageHandler.getLanguageDescription(self._NVDALocaleName)
-			if res:
-				self.__class__.WindowsLocalizedLangNamesToTesseractLocales[res] = self._TesseractLocaleName
-				self.__class__.TesseractLocalesToWindowsLocalizedLangNames[self._TesseractLocaleName] = res
-			else:
+			if not res:
 				# If there is no localized name for the given locale just return a language code.
 				# This is better than no name at all.
 				res = self._NVDALocaleName
+			# Even the language code is remembered, so that the language can be found by it.
+			self.__class__.WindowsLocalizedLangNamesToTesseractLocales[res] = self._TesseractLocaleName
+			self.__class__.TesseractLocalesToWindowsLocalizedLangNames[self._TesseractLocaleName] = res
 		return res
 
 	@property
@@ -189,54 +295,94 @@ class LanguageInfo:
 
 class HocrParser(object):
 
-	def __init__(self, xml, leftCoordOffset, topCoordOffset):
-		self.leftCoordOffset = leftCoordOffset
-		self.topCoordOffset = topCoordOffset
-		parser = expat.ParserCreate("utf-8")
-		parser.StartElementHandler = self._startElement
-		parser.EndElementHandler = self._endElement
-		parser.CharacterDataHandler = self._charData
+	def __init__(self, hocrFiles, pages):
+		"""@param hocrFiles: Binary file objects with hOCR, whose results are concatenated.
+		@param pages: L{pageInfo} for every recognized image
+		given in the order in which their pages appear in the hOCR files.
+		"""
+		self.leftCoordOffset = pages[0].left
+		self.topCoordOffset = pages[0].top
+		self._pages = iter(pages)
+		self._pageLeft = self._pageTop = 0
+		self._pageResizeFactor = IMAGE_RESIZE_FACTOR
+		self._pageLinesTops = None
+		self._isSkippingLine = False
+		# Thanks to buffer_text there is a single fragment per word or run of whitespace,
+		# and collapsed whitespace is always the same string, so a list joined at the end is cheap enough.
 		self._textList = []
+		self._appendText = self._textList.append
 		self.textLen = 0
 		self.lines = []
-		self.words = []
+		# Words are stored as parallel arrays of their offsets and coordinates
+		# rather than as a list of tuples, which is both smaller and faster to search.
+		self.wordOffsets = array.array("l")
+		self.wordLefts = array.array("l")
+		self.wordTops = array.array("l")
+		# Bound once, as these are called for every recognized word.
+		self._appendWordOffset = self.wordOffsets.append
+		self._appendWordLeft = self.wordLefts.append
+		self._appendWordTop = self.wordTops.append
 		self._hasBlockHadContent = False
-		parser.Parse(xml)
+		self._hasLastDataBeenSpace = False
+		for hocrFile in hocrFiles:
+			self._expatParser = expat.ParserCreate("utf-8")
+			self._expatParser.StartElementHandler = self._startElement
+			self._expatParser.EndElementHandler = self._endElement
+			self._expatParser.CharacterDataHandler = self._charData
+			# Deliver each run of text in a single callback rather than in many small chunks.
+			self._expatParser.buffer_text = True
+			self._expatParser.ParseFile(hocrFile)
+		del self._expatParser
 		self.text = "".join(self._textList)
-		del self._textList
+		del self._textList, self._appendText
 
 	def _startElement(self, tag, attrs):
-		if tag in ("p", "div"):
-			self._hasBlockHadContent = False
-		elif tag == "span":
-			cls = attrs["class"]
-			if cls == "ocr_line":
-				self.lines.append(self.textLen)
-			elif cls == "ocrx_word":
+		# Checks are ordered by how often each element occurs, words being the most common.
+		if tag == "span":
+			cls = attrs.get("class")
+			if cls == "ocrx_word":
+				if self._isSkippingLine:
+					return
 				# Get the coordinates from the bbox info specified in the title attribute.
-				title = attrs.get("title")
-				# cut non-bbox info if present
-				titleBbox = title.split(";")[0]
-				prefix, l, t, r, b = titleBbox.split(" ")
-				self.words.append(OcrWord(self.textLen,
-					self.leftCoordOffset + int(l) / IMAGE_RESIZE_FACTOR,
-					self.topCoordOffset + int(t) / IMAGE_RESIZE_FACTOR))
+				left, top = matchBbox(attrs["title"]).groups()
+				# Coordinates are only ever used as whole pixels, so integer division is sufficient.
+				self._appendWordOffset(self.textLen)
+				self._appendWordLeft(self._pageLeft + int(left) // self._pageResizeFactor)
+				self._appendWordTop(self._pageTop + int(top) // self._pageResizeFactor)
+			elif cls in LINE_CLASSES:
+				if self._pageLinesTops is not None:
+					self._isSkippingLine = int(matchBbox(attrs["title"]).group(2)) not in self._pageLinesTops
+					# Text of skipped lines is ignored by not having any handler for it at all.
+					self._expatParser.CharacterDataHandler = None if self._isSkippingLine else self._charData
+					if self._isSkippingLine:
+						return
+				self.lines.append(self.textLen)
+		elif tag == "p" or tag == "div":
+			self._hasBlockHadContent = False
+			if attrs.get("class") == "ocr_page":
+				self._pageLeft, self._pageTop, self._pageResizeFactor, self._pageLinesTops = next(self._pages)
 
 	def _endElement(self, tag):
+		# Nothing to do here, but with buffer_text expat flushes character data only before events having a handler.
+		# Without this the whitespace following a word would be delivered together with it,
+		# bypassing whitespace collapsing in L{_charData}.
 		pass
 
 	def _charData(self, data):
-		if data.isspace():
-			if not self._hasBlockHadContent:
-				# Strip whitespace at the start of a block.
-				return
-			# All other whitespace should be collapsed to a single space.
-			data = " "
-			if self._textList and self._textList[-1] == data:
-				return
-		self._hasBlockHadContent = True
-		self._textList.append(data)
-		self.textLen += len(data)
+		# Whitespace between hOCR elements always starts with an ASCII space or newline,
+		# so words are told apart by their first character without calling isspace for them.
+		if data[0] <= " " and data.isspace():
+			# Whitespace at the start of a block is stripped,
+			# all other whitespace is collapsed to a single space.
+			if self._hasBlockHadContent and not self._hasLastDataBeenSpace:
+				self._appendText(" ")
+				self.textLen += 1
+				self._hasLastDataBeenSpace = True
+		else:
+			self._appendText(data)
+			self.textLen += len(data)
+			self._hasBlockHadContent = True
+			self._hasLastDataBeenSpace = False
 
 
 class OcrTextInfo(textInfos.offsets.OffsetsTextInfo):
@@ -254,37 +400,35 @@ class OcrTextInfo(textInfos.offsets.OffsetsTextInfo):
 	def _getStoryLength(self):
 		return self._parser.textLen
 
+	def _getUnitOffsets(self, unitStarts, offset):
+		"""Finds the unit containing the given offset.
+		@param unitStarts: Sorted offsets at which units such as lines or words start.
+		"""
+		index = bisect.bisect_right(unitStarts, offset)
+		start = unitStarts[index - 1] if index else 0
+		end = unitStarts[index] if index < len(unitStarts) else self._parser.textLen
+		return (start, end)
+
 	def _getLineOffsets(self, offset):
-		start = 0
-		for end in self._parser.lines:
-			if end > offset:
-				return (start, end)
-			start = end
-		return (start, self._parser.textLen)
+		return self._getUnitOffsets(self._parser.lines, offset)
 
 	def _getWordOffsets(self, offset):
-		start = 0
-		for word in self._parser.words:
-			if word.offset > offset:
-				return (start, word.offset)
-			start = word.offset
-		return (start, self._parser.textLen)
+		return self._getUnitOffsets(self._parser.wordOffsets, offset)
 
 	def _getPointFromOffset(self, offset):
-		for nextWord in self._parser.words:
-			if nextWord.offset > offset:
-				break
-			word = nextWord
-		else:
+		index = bisect.bisect_right(self._parser.wordOffsets, offset)
+		if not index:
 			# No matching word, so use the top left of the object.
 			return locationHelper.Point(int(self._parser.leftCoordOffset), int(self._parser.topCoordOffset))
-		return locationHelper.Point(int(word.left), int(word.top))
+		return locationHelper.Point(self._parser.wordLefts[index - 1], self._parser.wordTops[index - 1])
 
 
 configSpecString = f"""
-	language = string(default={LanguageInfo.fromCurrentNVDALanguage().TesseractLocaleName})
+	language = string(default="")
 	quality = option({POSSIBLE_QUALITIES} default="fast")
 	priority = option({POSSIBLE_PRIORITIES} default="high")
+	imageEnlargement = option({POSSIBLE_IMAGE_ENLARGEMENTS} default="auto")
+	splitTallObjects = boolean(default=False)
 """
 confspec = ConfigObj(StringIO(configSpecString), list_values=False, encoding="UTF-8")
 confspec.newlines = "\r\n"
@@ -298,6 +442,7 @@ class OCRSettingsPanel(gui.SettingsPanel):
 	title = _("OCR settings")
 
 	def makeSettings(self, settingsSizer):
+		LanguageInfo.cacheLocalizedNames()
 		sHelper = gui.guiHelper.BoxSizerHelper(self, sizer = settingsSizer)
 		# Translators: Label of a radiobox used to optimize recognition for speed/quality
 		recogQualityLabel = _("During OCR, prefer")
@@ -306,7 +451,7 @@ class OCRSettingsPanel(gui.SettingsPanel):
 				self, label=recogQualityLabel, choices=[x.translatedName for x in OCR_QUALITIES.values()]
 			)
 		)
-		select = [k for k, v in OCR_QUALITIES.items() if v.dirName == config.conf["ocr"]["quality"]][0]
+		select = QUALITY_INDEXES_BY_DIR_NAME[config.conf["ocr"]["quality"]]
 		self.recogQualityRB.SetSelection(select)
 		self.recogQualityRB.Bind(wx.EVT_RADIOBOX, self.onQualityChange)
 		# Translators: Label of a  combobox used to choose a recognition language
@@ -328,15 +473,27 @@ class OCRSettingsPanel(gui.SettingsPanel):
 		priorityID = config.conf["ocr"]["priority"]
 		select = self.recogPriorityCB.FindString(OCR_PRIORITIES[priorityID].translatedName)
 		self.recogPriorityCB.SetSelection(select)
+		# Translators: Label of a  combobox used to choose whether images are enlarged before recognition
+		imageEnlargementLabel = _("&Enlarge images before recognition")
+		self.imageEnlargementCB = sHelper.addLabeledControl(
+			imageEnlargementLabel,
+			wx.Choice,
+			choices=[x.translatedName for x in OCR_IMAGE_ENLARGEMENTS.values()]
+		)
+		enlargementID = config.conf["ocr"]["imageEnlargement"]
+		select = self.imageEnlargementCB.FindString(OCR_IMAGE_ENLARGEMENTS[enlargementID].translatedName)
+		self.imageEnlargementCB.SetSelection(select)
+		# Translators: Label of a checkbox used to choose whether tall objects are recognized in parts in parallel
+		splitTallObjectsLabel = _("&Split tall objects for faster recognition (text in columns may be read in a different order)")
+		self.splitTallObjectsCheckBox = sHelper.addItem(wx.CheckBox(self, label=splitTallObjectsLabel))
+		self.splitTallObjectsCheckBox.SetValue(config.conf["ocr"]["splitTallObjects"])
 
 	def onQualityChange(self, evt):
 		self.updateCB()
 
 	def updateCB(self):
 		self.recogLanguageCB.Set(
-			[lang.localizedName for lang in LanguageInfo.fromAvailableLanguages(
-				OCR_QUALITIES[self.recogQualityRB.GetSelection()].dirName
-			)]
+			LanguageInfo.availableLocalizedNames(OCR_QUALITIES[self.recogQualityRB.GetSelection()].dirName)
 		)
 		select = self.recogLanguageCB.FindString(LanguageInfo.fromConfiguredLanguage().localizedName)
 		if select == wx.NOT_FOUND:
@@ -347,10 +504,16 @@ class OCRSettingsPanel(gui.SettingsPanel):
 		qualityIndex = self.recogQualityRB.GetSelection()
 		config.conf["ocr"]["quality"] = OCR_QUALITIES[qualityIndex].dirName
 		ocrLanguage = LanguageInfo(localizedName=self.recogLanguageCB.GetStringSelection())
-		config.conf["ocr"]["language"] = ocrLanguage.TesseractLocaleName
+		# Language is stored only when changed, so that until then it keeps following the language of NVDA.
+		if ocrLanguage.TesseractLocaleName != LanguageInfo.configuredTesseractLocaleName():
+			config.conf["ocr"]["language"] = ocrLanguage.TesseractLocaleName
 		priorityString = self.recogPriorityCB.GetStringSelection()
-		priorityID = [k for k, v in OCR_PRIORITIES.items() if v.translatedName == priorityString][0]
+		priorityID = PRIORITY_IDS_BY_TRANSLATED_NAME[priorityString]
 		config.conf["ocr"]["priority"] = priorityID
+		enlargementString = self.imageEnlargementCB.GetStringSelection()
+		enlargementID = IMAGE_ENLARGEMENT_IDS_BY_TRANSLATED_NAME[enlargementString]
+		config.conf["ocr"]["imageEnlargement"] = enlargementID
+		config.conf["ocr"]["splitTallObjects"] = self.splitTallObjectsCheckBox.GetValue()
 
 
 class GlobalPlugin(globalPluginHandler.GlobalPlugin):
@@ -358,8 +521,22 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 	def __init__(self):
 		super(globalPluginHandler.GlobalPlugin, self).__init__()
 		gui.NVDASettingsDialog.categoryClasses.append(OCRSettingsPanel)
+		# Images waiting to be recognized together with the objects from which they were captured.
+		self._pendingRecognitions = []
+		self._recognitionTimer = None
+		# Tesseract processes waiting for the next recognition, keyed by the arguments they were started with.
+		self._standbyTesseracts = {}
+		self._isRecognizing = False
+		# Object whose recognition is running, kept in the main thread as NVDAObjects must not be released elsewhere.
+		self._recognizedNav = None
+		self._isTerminated = False
 
 	def terminate(self):
+		# Recognition running in the background may still finish, but must not start any new processes.
+		self._isTerminated = True
+		if self._recognitionTimer is not None:
+			self._recognitionTimer.Stop()
+		self._stopStandbyTesseracts()
 		gui.NVDASettingsDialog.categoryClasses.remove(OCRSettingsPanel)
 
 	@scriptHandler.script(
@@ -379,72 +556,249 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		if left < 0 or top < 0 or width <= 0 or height <= 0:
 			ui.message(cannotRecognizeMSG)
 			return
-		bmp = wx.EmptyBitmap(width, height)
+		if any(
+			pendingNav == nav
+			and (page.left, page.top, pendingImg.GetWidth(), pendingImg.GetHeight()) == (left, top, width, height)
+			for pendingImg, page, pendingNav in self._pendingRecognitions
+		):
+			# Pressing the gesture repeatedly must not make the text of the object appear several times in the results.
+			return
+		bmp = wx.Bitmap(width, height)
 		mem = wx.MemoryDC(bmp)
 		mem.Blit(0, 0, width, height, wx.ScreenDC(), left, top)
+		# The bitmap has to be deselected from the DC before its pixels can be read.
+		mem.SelectObject(wx.NullBitmap)
 		img = bmp.ConvertToImage()
-		# Tesseract copes better if we convert to black and white...
-		img = img.ConvertToGreyscale()
-		# and increase the size.
-		img = img.Rescale(
-			width * IMAGE_RESIZE_FACTOR,
-			height * IMAGE_RESIZE_FACTOR,
-			quality=wx.IMAGE_QUALITY_BICUBIC
+		# Rest of the image processing is done in a background thread, see L{_prepareImage}.
+		# Starting Tesseract and loading its language data takes a significant part of the recognition time,
+		# so objects recognized in a quick succession are collected and passed to Tesseract at once.
+		self._pendingRecognitions.append((img, pageInfo(left, top, getImageResizeFactor()), nav))
+		if self._recognitionTimer is not None and self._recognitionTimer.IsRunning():
+			self._recognitionTimer.Start(BATCH_DELAY)
+		else:
+			self._recognitionTimer = wx.CallLater(BATCH_DELAY, self._recognizePending)
+
+	def _startTesseract(self, langArg, priorityID, singleThreaded=False):
+		if singleThreaded:
+			# Several single threaded processes scale much better than Tesseract's own multithreading.
+			env = dict(os.environ, OMP_THREAD_LIMIT="1")
+		else:
+			env = None
+		# Tesseract reads the input from stdin and writes hOCR to stdout,
+		# which also keeps its release info from being written to the console NVDA might be attached to.
+		return subprocess.Popen(
+			(TESSERACT_EXE, "stdin", "stdout", "--tessdata-dir", TESSDATA_BASEDIR, "-l", langArg, "hocr"),
+			stdin=subprocess.PIPE,
+			stdout=subprocess.PIPE,
+			creationflags=CREATE_NO_WINDOW | OCR_PRIORITIES[priorityID].priorityConstant,
+			env=env
 		)
-		baseFile = os.path.join(tempfile.gettempdir(), "nvda_ocr")
+
+	@staticmethod
+	def _killTesseract(proc):
+		proc.kill()
+		proc.stdin.close()
+		proc.stdout.close()
+		proc.wait()
+
+	def _stopStandbyTesseracts(self):
+		standbyTesseracts = self._standbyTesseracts
+		self._standbyTesseracts = {}
+		for proc in standbyTesseracts.values():
+			self._killTesseract(proc)
+
+	def _addStandbyTesseract(self, langArg, priorityID):
+		"""Starts Tesseract process waiting for the next recognition with the given arguments."""
+		if (langArg, priorityID) in self._standbyTesseracts:
+			return
+		self._standbyTesseracts[(langArg, priorityID)] = self._startTesseract(langArg, priorityID)
+		while len(self._standbyTesseracts) > MAX_STANDBY_TESSERACTS:
+			# Dictionaries preserve insertion order, so the first process is the least recently used one.
+			self._killTesseract(self._standbyTesseracts.pop(next(iter(self._standbyTesseracts))))
+
+	def _takeTesseract(self, langArg, priorityID):
+		"""Returns Tesseract process started with the given arguments, reusing the standby one if possible."""
+		proc = self._standbyTesseracts.pop((langArg, priorityID), None)
+		if proc is not None:
+			if proc.poll() is None:
+				return proc
+			self._killTesseract(proc)
+		return self._startTesseract(langArg, priorityID)
+
+	def _recognizePending(self):
+		if self._isRecognizing:
+			# These would be recognized as soon as the current recognition finishes.
+			return
+		pendingRecognitions = self._pendingRecognitions
+		self._pendingRecognitions = []
+		# When several objects were recognized at once their results are reviewed together from the last one.
+		self._recognizedNav = pendingRecognitions[-1][-1]
+		ocrLang = LanguageInfo.configuredTesseractLocaleName()
+		ocrQualityDir = config.conf["ocr"]["quality"]
+		langArg = '/'.join([ocrQualityDir, ocrLang])
+		priorityID = config.conf["ocr"]["priority"]
+		proc = self._takeTesseract(langArg, priorityID)
+		# Translators: Announced when recognition starts.
+		ui.message(_("Running OCR"))
+		# Recognition takes a while, so it is performed in a background thread to keep NVDA responsive.
+		self._isRecognizing = True
+		threading.Thread(
+			target=self._recognize,
+			args=(
+				[(img, page) for img, page, nav in pendingRecognitions],
+				proc,
+				(langArg, priorityID),
+				config.conf["ocr"]["splitTallObjects"]
+			),
+			daemon=True
+		).start()
+
+	@staticmethod
+	def _prepareImage(img, resizeFactor):
+		# Tesseract copes better if we increase the size, unless the text on screen is already large enough.
+		if resizeFactor != 1:
+			img = img.Rescale(
+				img.GetWidth() * resizeFactor,
+				img.GetHeight() * resizeFactor,
+				quality=wx.IMAGE_QUALITY_BILINEAR
+			)
+		return img
+
+	@staticmethod
+	def _saveImage(img, target):
+		# Tesseract copes better with black and white images.
+		# Rather than converting the image in a separate pass, it is converted to grey while saving,
+		# which also stores a single byte per pixel rather than three.
+		img.SetOption(wx.IMAGE_OPTION_BMP_FORMAT, wx.BMP_8BPP_GREY)
+		img.SaveFile(target, wx.BITMAP_TYPE_BMP)
+
+	@staticmethod
+	def _splitImage(img, page):
+		"""Splits image of a tall object into overlapping horizontal strips.
+		@return: Strips together with their L{pageInfo}, or C{None} if the image is not worth splitting.
+		"""
+		resizeFactor = page.resizeFactor
+		width = img.GetWidth()
+		height = img.GetHeight()
+		stripCount = min((os.cpu_count() or 1) // 2, MAX_STRIPS, height // MIN_STRIP_HEIGHT)
+		if stripCount < 2:
+			return None
+		stripHeight = -(-height // stripCount)
+		strips = []
+		for stripTop in range(0, height, stripHeight):
+			start = max(stripTop - STRIP_OVERLAP, 0)
+			end = min(stripTop + stripHeight + STRIP_OVERLAP, height)
+			strip = img.GetSubImage(wx.Rect(0, start, width, end - start))
+			# Lines starting in the overlap belong to the neighbouring strip.
+			# Strips are enlarged only after splitting, so lines are positioned in enlarged pixels.
+			linesTops = range((stripTop - start) * resizeFactor, (stripTop + stripHeight - start) * resizeFactor)
+			strips.append((strip, pageInfo(page.left, page.top + start, resizeFactor, linesTops)))
+		return strips
+
+	def _recognize(self, images, proc, tesseractArgs, splitTallObjects):
+		"""Runs in a background thread, results are passed to L{_onRecognized} in the main thread.
+		@param images: Captured images together with their L{pageInfo}.
+		@param splitTallObjects: Whether a single tall image may be split into strips, see L{_splitImage}.
+		"""
+		procs = [proc]
+		parser = None
+		imgFiles = []
 		try:
-			imgFile = baseFile + ".bmp"
-			img.SaveFile(imgFile)
-			# Translators: Announced when recognition starts.
-			ui.message(_("Running OCR"))
-			ocrLang = config.conf["ocr"]["language"]
-			ocrQualityDir = config.conf["ocr"]["quality"]
-			langArg = '/'.join([ocrQualityDir, ocrLang])
-			priorityID = config.conf["ocr"]["priority"]
-			priorityArg = OCR_PRIORITIES[priorityID].priorityConstant
-			# Hide the Tesseract window.
-			si = subprocess.STARTUPINFO()
-			si.dwFlags = subprocess.STARTF_USESHOWWINDOW
-			si.wShowWindow = subprocess.SW_HIDE
-			# If NVDA is attached to a console window Tesseract release info its written to this console.
-			# Stdout cannot be unconditionally redirected to null however, as it breaks  when focused window is not a console.
-			if api.getFocusObject().windowClassName == "ConsoleWindowClass":
-				redirecStdoutTo = subprocess.DEVNULL
+			pages = [page for img, page in images]
+			if len(images) == 1:
+				img, page = images[0]
+				strips = self._splitImage(img, page) if splitTallObjects else None
+				if strips is None:
+					strips = [(img, page)]
+				else:
+					# Images are split before being prepared,
+					# so that additional processes load their language data while the strips are enlarged and encoded.
+					procs.extend(self._startTesseract(*tesseractArgs, singleThreaded=True) for strip in strips[1:])
+				pages = [page for strip, page in strips]
+				tesseractInputs = []
+				for strip, page in strips:
+					# Images are passed straight through the pipe without touching the disk,
+					# and without copying the encoded data out of the buffer.
+					imgData = BytesIO()
+					self._saveImage(self._prepareImage(strip, page.resizeFactor), imgData)
+					tesseractInputs.append(imgData.getbuffer())
 			else:
-				redirecStdoutTo = None
+				# Tesseract opens the images listed in its input with the narrow C runtime functions,
+				# so their paths have to be in the ANSI code page,
+				# which may not be able to represent the long name of the temporary directory.
+				baseFile = os.path.join(getShortPathName(tempfile.gettempdir()), "nvda_ocr")
+				for index, (img, page) in enumerate(images):
+					imgFile = "{}_{}.bmp".format(baseFile, index)
+					self._saveImage(self._prepareImage(img, page.resizeFactor), imgFile)
+					imgFiles.append(imgFile)
+				# When stdin doesn't contain an image Tesseract treats it as a list of images to recognize,
+				# writing each of them as a separate page.
+				tesseractInputs = ["\n".join(imgFiles).encode("mbcs")]
 			try:
-				subprocess.check_call(
-					(TESSERACT_EXE, imgFile, baseFile, "--tessdata-dir", TESSDATA_BASEDIR, "-l", langArg, "hocr"),
-					startupinfo=si,
-					stdout=redirecStdoutTo,
-					creationflags=priorityArg
-				)
-			except subprocess.CalledProcessError as e:
-				log.info(e)
-				# Translators: error message when OCR fails
-				ui.message(_("Error during OCR, please see log (chosen language files are present?)"))
+				# All inputs are written before any output is read, so that the processes run in parallel.
+				for proc, tesseractInput in zip(procs, tesseractInputs):
+					with proc.stdin:
+						proc.stdin.write(tesseractInput)
+				parser = HocrParser([proc.stdout for proc in procs], pages)
+			except (OSError, expat.ExpatError):
+				log.debugWarning("Reading Tesseract output failed", exc_info=True)
+				parser = None
+				for proc in procs:
+					if not proc.stdin.closed:
+						# This process never received its input, so it would wait for it forever.
+						self._killTesseract(proc)
+			finally:
+				for proc in procs:
+					proc.stdout.close()
+			returnCodes = [proc.wait() for proc in procs]
+			if any(returnCodes) or parser is None:
+				log.info("Tesseract exited with codes {}".format(returnCodes))
+				parser = None
+				self._reportRecognitionError()
+		except Exception:
+			# Whatever went wrong, the user has to know that recognition failed.
+			log.error("Recognition failed", exc_info=True)
+			parser = None
+			self._reportRecognitionError()
 		finally:
-			try:
-				os.remove(imgFile)
-			except OSError:
-				pass
-		try:
-			hocrFile = baseFile + ".hocr"
-			parser = HocrParser(open(hocrFile, encoding='utf8').read(), left, top)
-		finally:
-			try:
-				os.remove(hocrFile)
-			except OSError:
-				pass
-		if parser.textLen == 0:
-			# Translators: Announced when OCR process succeeded, but no text was recognized.
-			ui.message(_("No text found."))
+			for proc in procs:
+				if proc.poll() is None:
+					# Something went wrong before Tesseract received its input.
+					self._killTesseract(proc)
+			for imgFile in imgFiles:
+				try:
+					os.remove(imgFile)
+				except OSError:
+					pass
+			wx.CallAfter(self._onRecognized, parser, tesseractArgs)
+
+	@staticmethod
+	def _reportRecognitionError():
+		# Translators: error message when OCR fails
+		wx.CallAfter(ui.message, _("Error during OCR, please see log (chosen language files are present?)"))
+
+	def _onRecognized(self, parser, tesseractArgs):
+		self._isRecognizing = False
+		nav = self._recognizedNav
+		self._recognizedNav = None
+		if self._isTerminated:
 			return
-		# Let the user review the OCR output.
-		# TextInfo of the navigator object cannot be overwritten dirrectly as this makes it impossible to navigate with the caret in edit fields.
-		# Create a shallow copy of the navigator object and overwrite there.
-		objWithResults = copy(nav)
-		objWithResults.makeTextInfo = lambda position: OcrTextInfo(objWithResults, position, parser)
-		api.setReviewPosition(objWithResults.makeTextInfo(textInfos.POSITION_FIRST))
-		# Translators: Announced when recognition is finished.
-		ui.message(_("Done"))
+		if parser is not None:
+			# Tesseract initializes and loads language data before reading its input,
+			# so starting the process for the next recognition now makes it ready by the time it is needed.
+			self._addStandbyTesseract(*tesseractArgs)
+			if parser.textLen == 0:
+				# Translators: Announced when OCR process succeeded, but no text was recognized.
+				ui.message(_("No text found."))
+			else:
+				# Let the user review the OCR output.
+				# TextInfo of the navigator object cannot be overwritten dirrectly as this makes it impossible to navigate with the caret in edit fields.
+				# Create a shallow copy of the navigator object and overwrite there.
+				# It remains a real NVDAObject, so that everything else, braille included, treats it as such.
+				objWithResults = copy(nav)
+				objWithResults.makeTextInfo = lambda position: OcrTextInfo(objWithResults, position, parser)
+				api.setReviewPosition(objWithResults.makeTextInfo(textInfos.POSITION_FIRST))
+				# Translators: Announced when recognition is finished.
+				ui.message(_("Done"))
+		if self._pendingRecognitions and not self._recognitionTimer.IsRunning():
+			self._recognizePending()